@@ -0,0 +1,59 @@
+"""
+Static content for the fallback API documentation
+Describes the expected assemblies when XML generation is unavailable
+"""
+
+# Basic documentation for each expected assembly
+ASSEMBLIES = {
+    "Belay.Core": {
+        "description": "Core library providing device communication, method execution, and session management",
+        "key_classes": [
+            "**Device** - Main device connection and communication class",
+            "  - `ConnectAsync(string port)` - Connect to device on specified port",
+            "  - `ExecuteAsync<T>(string code)` - Execute Python code and return typed result", 
+            "  - `StartAsync()` - Initialize device communication",
+            "**TaskExecutor** - Handles [Task] attribute method execution",
+            "  - `ExecuteTaskAsync(MethodInfo, object[])` - Execute attributed method on device",
+            "  - Supports caching, timeouts, and result serialization",
+            "**EnhancedExecutor** - Advanced method interception framework",
+            "  - Pipeline-based execution with validation stages",
+            "  - Method interception caching and deployment optimization",
+            "**SerialDeviceCommunication** - USB/Serial device communication",
+            "  - `SendAsync(string)` - Send commands to device", 
+            "  - `ReceiveAsync()` - Receive responses from device",
+            "  - Automatic protocol detection and flow control"
+        ]
+    },
+    "Belay.Attributes": {
+        "description": "Attribute definitions for marking methods for device execution",
+        "key_classes": [
+            "**TaskAttribute** - Execute methods as remote tasks with caching and timeout",
+            "  - Properties: `Cache` (bool) - Enable method result caching",
+            "  - Properties: `TimeoutMs` (int) - Method execution timeout in milliseconds", 
+            "  - Properties: `Retry` (int) - Number of retry attempts on failure",
+            "  - Usage: `[Task(Cache = true, TimeoutMs = 5000)]`",
+            "**ThreadAttribute** - Background thread execution on device",
+            "  - Properties: `Priority` (ThreadPriority) - Thread execution priority",
+            "  - Properties: `AutoStart` (bool) - Whether to start thread automatically",
+            "  - Usage: `[Thread(Priority = ThreadPriority.High)]`",
+            "**SetupAttribute** - Device initialization methods",
+            "  - Called once when device connects and establishes communication",
+            "  - Perfect for hardware initialization: sensors, pins, configurations",
+            "  - Usage: `[Setup] public async Task InitializeAsync() { ... }`",
+            "**TeardownAttribute** - Device cleanup methods", 
+            "  - Called during device disconnection or disposal",
+            "  - Used for resource cleanup and proper device shutdown",
+            "  - Usage: `[Teardown] public async Task CleanupAsync() { ... }`",
+            "**ThreadPriority** - Enumeration for thread execution priorities",
+            "  - Values: `Low`, `Normal`, `High`, `Critical`",
+            "  - Used with ThreadAttribute to control execution priority"
+        ]
+    },
+    "Belay.Sync": {
+        "description": "File synchronization and device file system operations",
+        "key_classes": [
+            "DeviceFileSystem - File operations on MicroPython device",
+            "DeviceExtensions - Extension methods for device file operations"
+        ]
+    }
+}
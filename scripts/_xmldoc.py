@@ -0,0 +1,126 @@
+"""
+Streaming reader for .NET XML documentation files
+Collects <member> documentation from expat callbacks, without building an element tree
+"""
+
+import os
+
+# Bytes fed to the parser per read
+CHUNK_SIZE = 128 * 1024
+
+class MemberExtractor:
+    """Expat handler set that turns each <member> into a plain dict
+
+    Member dicts have the keys:
+      name     - the member's name attribute, e.g. "M:Belay.Core.Device.ConnectAsync"
+      children - (tag, text) for each direct child, in document order
+      params   - (name, text) for each <param> child
+      examples - full text content of each <example> child
+
+    As with Element.text, a child's text is only the text before its first
+    nested tag, or None when there is none.
+    """
+
+    def __init__(self):
+        self.assembly_name = None
+        self.members = []
+        self._stack = []  # [tag, attrib, text parts, text closed] per open element
+        self._member = None
+        self._member_depth = 0
+        self._example = None  # text buffer of the open <example> child
+
+    def start(self, tag, attrib):
+        if self._stack:
+            # Leading text of the parent ends at its first child
+            self._stack[-1][3] = True
+        self._stack.append([tag, attrib, [], False])
+        
+        if self._member is None:
+            if tag == 'member':
+                self._member = {
+                    'name': attrib.get('name', ''),
+                    'children': [],
+                    'params': [],
+                    'examples': []
+                }
+                self._member_depth = len(self._stack)
+        elif tag == 'example' and len(self._stack) == self._member_depth + 1:
+            self._example = []
+
+    def data(self, text):
+        top = self._stack[-1] if self._stack else None
+        if top is not None and not top[3]:
+            top[2].append(text)
+        if self._example is not None:
+            self._example.append(text)
+
+    def end(self, tag):
+        tag, attrib, parts, _ = self._stack.pop()
+        text = ''.join(parts) or None
+        member = self._member
+        
+        if member is None:
+            if tag == 'name' and self.assembly_name is None and self._stack and self._stack[-1][0] == 'assembly':
+                self.assembly_name = text
+            return
+        
+        depth = len(self._stack)
+        if depth < self._member_depth:
+            # Closing the <member> itself
+            self.members.append(member)
+            self._member = None
+            return
+        
+        if depth == self._member_depth:
+            member['children'].append((tag, text))
+            if tag == 'param':
+                member['params'].append((attrib.get('name', ''), text))
+            elif tag == 'example':
+                member['examples'].append(''.join(self._example))
+                self._example = None
+
+def iter_members(xml_file, extractor=None):
+    """Yield member dicts as they are parsed, so only one chunk's worth is held at a time"""
+    # Deferred so runs with no XML files never load the xml package
+    from xml.parsers import expat
+
+    if extractor is None:
+        extractor = MemberExtractor()
+    parser = expat.ParserCreate()
+    # Deliver each run of text in one callback instead of per line/entity
+    parser.buffer_text = True
+    parser.buffer_size = CHUNK_SIZE
+    parser.StartElementHandler = extractor.start
+    parser.EndElementHandler = extractor.end
+    parser.CharacterDataHandler = extractor.data
+    pending = extractor.members
+    with open(xml_file, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            parser.Parse(chunk, False)
+            yield from pending
+            pending.clear()
+    parser.Parse(b'', True)
+    yield from pending
+    pending.clear()
+
+def read_members(xml_file):
+    """Parse an XML documentation file, returning (assembly_name, members)"""
+    extractor = MemberExtractor()
+    members = list(iter_members(xml_file, extractor))
+    return extractor.assembly_name, members
+
+def iter_xml_files(src_dir="belay-source/src"):
+    """Yield built XML doc files (src/*/bin/Release/net8.0/*.xml), skipping reference assemblies"""
+    if not os.path.isdir(src_dir):
+        return
+    with os.scandir(src_dir) as packages:
+        for package in packages:
+            if package.name.startswith('.'):
+                continue
+            leaf = os.path.join(package.path, "bin", "Release", "net8.0")
+            if not os.path.isdir(leaf):
+                continue
+            with os.scandir(leaf) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.xml') and not entry.name.startswith('.') and '/ref/' not in entry.path:
+                        yield entry.path
@@ -7,95 +7,16 @@ Creates basic API documentation when XML generation fails
 import os
 from pathlib import Path
 
-def create_fallback_api():
-    """Create fallback API documentation"""
-    
-    # Ensure api/generated directory exists
-    api_generated = Path("api/generated")
-    api_generated.mkdir(parents=True, exist_ok=True)
-    
-    # Create basic documentation for each expected assembly
-    assemblies = {
-        "Belay.Core": {
-            "description": "Core library providing device communication, method execution, and session management",
-            "key_classes": [
-                "**Device** - Main device connection and communication class",
-                "  - `ConnectAsync(string port)` - Connect to device on specified port",
-                "  - `ExecuteAsync<T>(string code)` - Execute Python code and return typed result", 
-                "  - `StartAsync()` - Initialize device communication",
-                "**TaskExecutor** - Handles [Task] attribute method execution",
-                "  - `ExecuteTaskAsync(MethodInfo, object[])` - Execute attributed method on device",
-                "  - Supports caching, timeouts, and result serialization",
-                "**EnhancedExecutor** - Advanced method interception framework",
-                "  - Pipeline-based execution with validation stages",
-                "  - Method interception caching and deployment optimization",
-                "**SerialDeviceCommunication** - USB/Serial device communication",
-                "  - `SendAsync(string)` - Send commands to device", 
-                "  - `ReceiveAsync()` - Receive responses from device",
-                "  - Automatic protocol detection and flow control"
-            ]
-        },
-        "Belay.Attributes": {
-            "description": "Attribute definitions for marking methods for device execution",
-            "key_classes": [
-                "**TaskAttribute** - Execute methods as remote tasks with caching and timeout",
-                "  - Properties: `Cache` (bool) - Enable method result caching",
-                "  - Properties: `TimeoutMs` (int) - Method execution timeout in milliseconds", 
-                "  - Properties: `Retry` (int) - Number of retry attempts on failure",
-                "  - Usage: `[Task(Cache = true, TimeoutMs = 5000)]`",
-                "**ThreadAttribute** - Background thread execution on device",
-                "  - Properties: `Priority` (ThreadPriority) - Thread execution priority",
-                "  - Properties: `AutoStart` (bool) - Whether to start thread automatically",
-                "  - Usage: `[Thread(Priority = ThreadPriority.High)]`",
-                "**SetupAttribute** - Device initialization methods",
-                "  - Called once when device connects and establishes communication",
-                "  - Perfect for hardware initialization: sensors, pins, configurations",
-                "  - Usage: `[Setup] public async Task InitializeAsync() { ... }`",
-                "**TeardownAttribute** - Device cleanup methods", 
-                "  - Called during device disconnection or disposal",
-                "  - Used for resource cleanup and proper device shutdown",
-                "  - Usage: `[Teardown] public async Task CleanupAsync() { ... }`",
-                "**ThreadPriority** - Enumeration for thread execution priorities",
-                "  - Values: `Low`, `Normal`, `High`, `Critical`",
-                "  - Used with ThreadAttribute to control execution priority"
-            ]
-        },
-        "Belay.Sync": {
-            "description": "File synchronization and device file system operations",
-            "key_classes": [
-                "DeviceFileSystem - File operations on MicroPython device",
-                "DeviceExtensions - Extension methods for device file operations"
-            ]
-        }
-    }
-    
-    for assembly_name, info in assemblies.items():
-        assembly_dir = api_generated / assembly_name
-        assembly_dir.mkdir(exist_ok=True)
-        
-        with open(assembly_dir / "README.md", "w") as f:
-            f.write(f"# {assembly_name} API Reference\n\n")
-            f.write("*Fallback documentation - XML generation unavailable*\n\n")
-            f.write(f"## Overview\n\n{info['description']}\n\n")
-            f.write("## Key Classes\n\n")
-            
-            for class_info in info['key_classes']:
-                f.write(f"- **{class_info}**\n")
-            
-            f.write(f"\n## Full Documentation\n\n")
-            f.write("Complete API documentation with method signatures and detailed descriptions ")
-            f.write("will be available when the .NET build pipeline is restored.\n\n")
-    
-    # Create main API index
-    with open("api/index.md", "w") as f:
-        f.write("# API Reference\n\n")
-        f.write("*Using fallback documentation due to build issues*\n\n")
-        f.write("## Generated Documentation\n\n")
-        
-        for assembly in sorted(assemblies.keys()):
-            f.write(f"- **[{assembly}](./generated/{assembly}/README.md)** - {assembly} API documentation\n")
-        
-        f.write("""
+from _fallback_data import ASSEMBLIES
+
+# Static blocks shared by every generated file, encoded once at import
+README_FOOTER = (
+    "\n## Full Documentation\n\n"
+    "Complete API documentation with method signatures and detailed descriptions "
+    "will be available when the .NET build pipeline is restored.\n\n"
+).encode('utf-8')
+
+INDEX_FOOTER = """
 
 ## Quick Reference
 
@@ -119,7 +40,43 @@ For practical examples, see the [Examples](/examples/) section.
 
 This documentation is currently using fallback content due to .NET build pipeline issues. 
 Full XML-generated documentation will be restored once the build issues are resolved.
-""")
+""".encode('utf-8')
+
+def create_fallback_api():
+    """Create fallback API documentation"""
+    
+    # Ensure api/generated directory exists
+    api_generated = Path("api/generated")
+    api_generated.mkdir(parents=True, exist_ok=True)
+    
+    # Create basic documentation for each expected assembly
+    for assembly_name, info in ASSEMBLIES.items():
+        assembly_dir = api_generated / assembly_name
+        assembly_dir.mkdir(exist_ok=True)
+        
+        parts = []
+        append = parts.append
+        append(f"# {assembly_name} API Reference\n\n")
+        append("*Fallback documentation - XML generation unavailable*\n\n")
+        append(f"## Overview\n\n{info['description']}\n\n")
+        append("## Key Classes\n\n")
+        
+        for class_info in info['key_classes']:
+            append(f"- **{class_info}**\n")
+        
+        (assembly_dir / "README.md").write_bytes(''.join(parts).encode('utf-8') + README_FOOTER)
+    
+    # Create main API index
+    parts = []
+    append = parts.append
+    append("# API Reference\n\n")
+    append("*Using fallback documentation due to build issues*\n\n")
+    append("## Generated Documentation\n\n")
+    
+    for assembly in sorted(ASSEMBLIES.keys()):
+        append(f"- **[{assembly}](./generated/{assembly}/README.md)** - {assembly} API documentation\n")
+    
+    Path("api/index.md").write_bytes(''.join(parts).encode('utf-8') + INDEX_FOOTER)
     
     print("✅ Created fallback API documentation")
 
@@ -3,56 +3,48 @@
 Debug XML content to see what's available for API generation
 """
 
-import xml.etree.ElementTree as ET
 import os
 import sys
-import glob
 from pathlib import Path
 
+from _xmldoc import iter_xml_files, read_members
+
 def debug_xml_file(xml_file):
     """Debug XML file content"""
     print(f"\n=== DEBUGGING {xml_file} ===")
     try:
-        tree = ET.parse(xml_file)
-        root = tree.getroot()
-        
-        assembly_name = root.find('assembly/name').text
+        assembly_name, members = read_members(xml_file)
         print(f"Assembly: {assembly_name}")
         
-        members = root.findall('.//member')
         print(f"Total members found: {len(members)}")
         
         # Sample a few members to see structure
         for i, member in enumerate(members[:5]):
-            name = member.get('name', 'NO_NAME')
+            name = member['name'] or 'NO_NAME'
             print(f"\nMember {i+1}: {name}")
             
-            # Check all child elements
-            for child in member:
-                print(f"  - {child.tag}: {child.text[:100] if child.text else 'None'}...")
+            # Check all child elements, remembering the first of each tag
+            children = {}
+            for tag, text in member['children']:
+                print(f"  - {tag}: {text[:100] if text else 'None'}...")
+                children.setdefault(tag, text)
             
             # Check for specific documentation elements
-            summary = member.find('summary')
-            remarks = member.find('remarks')
-            example = member.find('example')
-            
-            print(f"  Has summary: {summary is not None}")
-            print(f"  Has remarks: {remarks is not None}")
-            print(f"  Has example: {example is not None}")
+            print(f"  Has summary: {'summary' in children}")
+            print(f"  Has remarks: {'remarks' in children}")
+            print(f"  Has example: {'example' in children}")
             
             if name.startswith('T:Belay.Attributes.TaskAttribute'):
                 print(f"  FOUND TaskAttribute!")
-                if example is not None:
-                    print(f"  Example content: {example.text}")
+                if 'example' in children:
+                    print(f"  Example content: {children['example']}")
             
     except Exception as e:
         print(f"Error: {e}")
 
 def main():
     """Main function"""
-    xml_pattern = "belay-source/src/*/bin/Release/net8.0/*.xml"
-    xml_files = glob.glob(xml_pattern)
-    xml_files = [f for f in xml_files if '/ref/' not in f]
+    xml_files = list(iter_xml_files())
     
     print(f"Found {len(xml_files)} XML files:")
     for xml_file in xml_files:
@@ -3,191 +3,319 @@
 Simple and reliable API documentation generator
 """
 
-import xml.etree.ElementTree as ET
 import os
+import re
 import sys
 import glob
-from pathlib import Path
+import functools
+from collections import defaultdict
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
 
+import _xmldoc
+from _xmldoc import MemberExtractor, iter_members, iter_xml_files
+
+# Characters VitePress/Vue would interpret in headings, escaped in one pass
+VITEPRESS_ESCAPES = str.maketrans({'{': '\\{', '}': '\\}', '<': '\\<', '>': '\\>'})
+
+# Markdown layout of one type section and of one method within it
+TYPE_TEMPLATE = "## {name}\n\n{summary}\n\n{remarks_block}{methods_block}{properties_block}{examples_block}---\n\n"
+METHOD_TEMPLATE = "#### {signature}\n\n{summary}\n\n{params_block}{returns_block}"
+
+# Generic arity markers on method names, e.g. "Get``1"
+GENERIC_ARITY = re.compile(r'``(\d+)')
+
+def generic_placeholder(match):
+    """Render a ``N arity marker as type parameters: <T>, <T,U>, then <T1,...,TN>"""
+    arity = int(match.group(1))
+    if arity == 1:
+        return '<T>'
+    if arity == 2:
+        return '<T,U>'
+    return '<' + ','.join(f"T{i}" for i in range(1, arity + 1)) + '>'
+
+@functools.lru_cache(maxsize=8192)
 def clean_text(text):
-    """Clean up XML text"""
+    """Clean up XML text (cached, since boilerplate descriptions repeat a lot)"""
     if not text:
         return "No description available"
     return ' '.join(text.strip().split())
 
-def create_assembly_docs(xml_file):
-    """Create comprehensive documentation for one assembly"""
+def split_type_prefix(method_name):
+    """Return the declaring type of a method name (without the M: prefix)"""
+    # Extract type prefix correctly for methods with parameters
+    if '(' in method_name:
+        # Method has parameters, find the last dot before the method name
+        paren_index = method_name.find('(')
+        before_paren = method_name[:paren_index]  # e.g., "Belay.Core.Caching.IMethodDeploymentCache.Get``1"
+        return before_paren.rsplit('.', 1)[0]  # e.g., "Belay.Core.Caching.IMethodDeploymentCache"
+    
+    # No parameters, use original logic
+    return method_name.split('#')[0] if '#' in method_name else method_name.rsplit('.', 1)[0]
+
+def format_method_display(full_name):
+    """Return the method heading shown in the docs, escaped for VitePress"""
+    # Extract method name and signature properly
+    if '(' in full_name:
+        # Find the method name before the opening parenthesis
+        paren_index = full_name.find('(')
+        before_paren = full_name[:paren_index]  # Everything before (
+        after_paren = full_name[paren_index:]   # Everything from ( onwards
+        
+        # Get just the method name part (last component before params)
+        _, _, method_name_part = before_paren.rpartition('.')  # e.g., "Get``1"
+        
+        # Clean up generic markers and combine with parameters  
+        clean_method_name = GENERIC_ARITY.sub(generic_placeholder, method_name_part)
+        method_display = clean_method_name + after_paren
+        
+        # Escape problematic characters for VitePress/Vue
+        return method_display.translate(VITEPRESS_ESCAPES)
+    
+    # No parameters - just method name
+    _, _, method_display = full_name.rpartition('.')
+    return method_display
+
+def collect_type(type_name, member, children, summary, types, methods, properties):
+    """Record a T: member"""
+    types[type_name] = {
+        'summary': summary,
+        'remarks': clean_text(children.get('remarks')),
+        'examples': []
+    }
+    
+    # Extract examples (text content including nested tags)
+    for example_content in member['examples']:
+        if example_content and len(example_content.strip()) > 10:
+            types[type_name]['examples'].append(example_content.strip())
+
+def collect_method(method_name, member, children, summary, types, methods, properties):
+    """Record an M: member under its declaring type"""
+    # Many members share a declaring type; intern so the dict keys are shared objects
+    type_prefix = sys.intern(split_type_prefix(method_name))
+    
+    # Extract parameters
+    params = []
+    for param_name, param_text in member['params']:
+        param_desc = clean_text(param_text)
+        params.append((sys.intern(param_name), param_desc))
+    
+    # Extract return value
+    returns = clean_text(children.get('returns'))
+    
+    methods[type_prefix].append({
+        'name': method_name,
+        'summary': summary,
+        'parameters': params,
+        'returns': returns
+    })
+
+def collect_property(prop_name, member, children, summary, types, methods, properties):
+    """Record a P: member under its declaring type"""
+    type_prefix = sys.intern(prop_name.rsplit('.', 1)[0])
+    
+    properties[type_prefix].append({
+        'name': prop_name,
+        'summary': summary
+    })
+
+# Member kind prefix -> collector
+MEMBER_HANDLERS = {
+    'T:': collect_type,
+    'M:': collect_method,
+    'P:': collect_property
+}
+
+def render_method(method):
+    """Render one method entry of a type section"""
+    params_block = ""
+    if method['parameters']:
+        params_block = "**Parameters:**\n\n" + ''.join(
+            f"- `{param_name}`: {param_desc}\n" for param_name, param_desc in method['parameters']
+        ) + "\n"
+    
+    returns_block = f"**Returns:** {method['returns']}\n\n" if method['returns'] else ""
+    
+    return METHOD_TEMPLATE.format_map({
+        'signature': format_method_display(method['name']),
+        'summary': method['summary'],
+        'params_block': params_block,
+        'returns_block': returns_block
+    })
+
+def render_property(prop):
+    """Render one property entry of a type section"""
+    _, _, prop_short = prop['name'].rpartition('.')
+    return f"#### {prop_short}\n\n{prop['summary']}\n\n"
+
+def render_example(index, example):
+    """Render one example of a type section"""
+    # Clean up the example text and format properly
+    clean_example = example.replace('&lt;', '<').replace('&gt;', '>')
+    # Look for code sections
+    if 'public class' in clean_example or '[Task' in clean_example:
+        return f"**Example {index+1}:**\n\n```csharp\n{clean_example}\n```\n\n"
+    return f"**Example {index+1}:**\n\n{clean_example}\n\n"
+
+def stamp_key(xml_file):
+    """Fingerprint of an XML input and of the generator code, for incremental builds"""
+    xml_stat = os.stat(xml_file)
+    # _xmldoc decides what is extracted, so it counts as part of the generator
+    script_stat = os.stat(__file__)
+    reader_stat = os.stat(_xmldoc.__file__)
+    return f"{xml_stat.st_mtime_ns}:{xml_stat.st_size}:{script_stat.st_mtime_ns}:{reader_stat.st_mtime_ns}"
+
+def file_fingerprint(path):
+    """Return mtime and size of path, to tell whether a file was rewritten since"""
+    path_stat = os.stat(path)
+    return f"{path_stat.st_mtime_ns}:{path_stat.st_size}"
+
+def assembly_stem(xml_file):
+    """Return the XML file name without directory or extension"""
+    return os.path.splitext(os.path.basename(xml_file))[0]
+
+def read_stamp(xml_file, key):
+    """Return the stored (total, documented) counts if the docs for xml_file are up to date
+    
+    The .stamp file holds the stamp_key, the counts and the fingerprint of the
+    README written alongside it.
+    """
+    # XML doc files are named after their assembly, so look in that output directory
+    output_dir = os.path.join("api", "generated", assembly_stem(xml_file))
+    stamp = os.path.join(output_dir, ".stamp")
+    readme = os.path.join(output_dir, "README.md")
+    if not os.path.exists(stamp) or not os.path.exists(readme):
+        return None
     try:
-        tree = ET.parse(xml_file)
-        root = tree.getroot()
+        with open(stamp) as f:
+            stored_key, counts, readme_print = f.read().splitlines()[:3]
+        if stored_key != key:
+            return None
+        # Another script (e.g. create-fallback-api) may have replaced the README
+        if readme_print != file_fingerprint(readme):
+            return None
+        total_members, documented_members = (int(n) for n in counts.split())
+        return total_members, documented_members
+    except ValueError:
+        return None
+
+def create_assembly_docs(xml_file, force=False):
+    """Create comprehensive documentation for one assembly
+    
+    Returns a (success, total_members, documented_members) tuple so the
+    caller can judge documentation quality without re-parsing the XML.
+    Unchanged inputs are skipped unless force is set.
+    """
+    try:
+        key = stamp_key(xml_file)
+        if not force:
+            counts = read_stamp(xml_file, key)
+            if counts is not None:
+                print(f"✅ Docs for {assembly_stem(xml_file)} are up to date")
+                return (True,) + counts
         
-        assembly_name = root.find('assembly/name').text
-        output_dir = Path(f"api/generated/{assembly_name}")
-        output_dir.mkdir(parents=True, exist_ok=True)
+        total_members = 0
+        documented_members = 0
         
         # Organize members by type
         types = {}
-        methods = {}
-        properties = {}
+        methods = defaultdict(list)
+        properties = defaultdict(list)
         
-        for member in root.findall('.//member'):
-            name = member.get('name', '')
-            summary_elem = member.find('summary')
-            summary = clean_text(summary_elem.text if summary_elem is not None else "")
+        # Members stream in as plain dicts; no element tree is built
+        extractor = MemberExtractor()
+        for member in iter_members(xml_file, extractor):
+            name = member['name']
+            
+            # Text of the first direct child of each tag
+            children = {}
+            for tag, text in member['children']:
+                children.setdefault(tag, text)
             
-            if name.startswith('T:'):
-                # Type documentation
-                type_name = name[2:]
-                types[type_name] = {
-                    'summary': summary,
-                    'remarks': clean_text(member.find('remarks').text if member.find('remarks') is not None else ""),
-                    'examples': []
-                }
-                
-                # Extract examples (including nested XML content)
-                for example in member.findall('.//example'):
-                    if example is not None:
-                        # Get all text content including nested tags
-                        example_content = ET.tostring(example, encoding='unicode', method='text')
-                        if example_content and len(example_content.strip()) > 10:
-                            types[type_name]['examples'].append(example_content.strip())
-                        
-            elif name.startswith('M:'):
-                # Method documentation
-                method_name = name[2:]
-                
-                # Extract type prefix correctly for methods with parameters
-                if '(' in method_name:
-                    # Method has parameters, find the last dot before the method name
-                    paren_index = method_name.find('(')
-                    before_paren = method_name[:paren_index]  # e.g., "Belay.Core.Caching.IMethodDeploymentCache.Get``1"
-                    type_prefix = before_paren.rsplit('.', 1)[0]  # e.g., "Belay.Core.Caching.IMethodDeploymentCache"
-                else:
-                    # No parameters, use original logic
-                    type_prefix = method_name.split('#')[0] if '#' in method_name else method_name.rsplit('.', 1)[0]
-                
-                if type_prefix not in methods:
-                    methods[type_prefix] = []
-                
-                # Extract parameters
-                params = []
-                for param in member.findall('.//param'):
-                    param_name = param.get('name', '')
-                    param_desc = clean_text(param.text if param.text else "")
-                    params.append((param_name, param_desc))
-                
-                # Extract return value
-                returns_elem = member.find('returns')
-                returns = clean_text(returns_elem.text if returns_elem is not None else "")
-                
-                methods[type_prefix].append({
-                    'name': method_name,
-                    'summary': summary,
-                    'parameters': params,
-                    'returns': returns
-                })
-                
-            elif name.startswith('P:'):
-                # Property documentation
-                prop_name = name[2:]
-                type_prefix = prop_name.rsplit('.', 1)[0]
-                
-                if type_prefix not in properties:
-                    properties[type_prefix] = []
-                
-                properties[type_prefix].append({
-                    'name': prop_name,
-                    'summary': summary
-                })
+            summary_text = children.get('summary')
+            summary = clean_text(summary_text)
+            
+            # Count members with actual documentation; raw text of 20 chars or
+            # fewer can't pass, so only longer summaries pay for the strip
+            total_members += 1
+            if summary_text and len(summary_text) > 20 and len(summary_text.strip()) > 20:
+                documented_members += 1
+            
+            # Dispatch on the member kind prefix; other kinds (F:, E:) are not documented
+            handler = MEMBER_HANDLERS.get(name[:2])
+            if handler is not None:
+                handler(name[2:], member, children, summary, types, methods, properties)
+        
+        assembly_name = extractor.assembly_name
+        output_dir = os.path.join("api", "generated", assembly_name)
+        os.makedirs(output_dir, exist_ok=True)
         
         # Generate comprehensive documentation
-        with open(output_dir / "README.md", "w") as f:
-            f.write(f"# {assembly_name} API Reference\n\n")
-            f.write("Comprehensive API documentation generated from XML comments.\n\n")
-            f.write(f"## Overview\n\n{len(types)} types documented in this assembly.\n\n")
+        parts = []
+        append = parts.append
+        append(f"# {assembly_name} API Reference\n\n")
+        append("Comprehensive API documentation generated from XML comments.\n\n")
+        append(f"## Overview\n\n{len(types)} types documented in this assembly.\n\n")
+        
+        # Generate detailed type documentation
+        for type_name, type_info in islice(types.items(), 15):  # Limit for size
+            remarks = type_info['remarks']
+            remarks_block = f"### Remarks\n\n{remarks}\n\n" if remarks else ""
+            
+            # Add methods for this type
+            methods_block = ""
+            if type_name in methods:
+                methods_block = "### Methods\n\n" + ''.join(
+                    render_method(method) for method in methods[type_name][:15]  # Show more methods per type
+                )
+            
+            # Add properties for this type
+            properties_block = ""
+            if type_name in properties:
+                properties_block = "### Properties\n\n" + ''.join(
+                    render_property(prop) for prop in properties[type_name][:5]  # Limit properties per type
+                )
             
-            # Generate detailed type documentation
-            for type_name, type_info in list(types.items())[:15]:  # Limit for size
-                f.write(f"## {type_name}\n\n")
-                f.write(f"{type_info['summary']}\n\n")
-                
-                if type_info['remarks']:
-                    f.write(f"### Remarks\n\n{type_info['remarks']}\n\n")
-                
-                # Add methods for this type
-                if type_name in methods:
-                    f.write("### Methods\n\n")
-                    for method in methods[type_name][:15]:  # Show more methods per type
-                        # Extract method signature with parameters
-                        full_name = method['name']
-                        
-                        # Extract method name and signature properly
-                        if '(' in full_name:
-                            # Find the method name before the opening parenthesis
-                            paren_index = full_name.find('(')
-                            before_paren = full_name[:paren_index]  # Everything before (
-                            after_paren = full_name[paren_index:]   # Everything from ( onwards
-                            
-                            # Get just the method name part (last component before params)
-                            method_name_part = before_paren.split('.')[-1]  # e.g., "Get``1"
-                            
-                            # Clean up generic markers and combine with parameters  
-                            clean_method_name = method_name_part.replace('``1', '<T>').replace('``2', '<T,U>')
-                            method_display = clean_method_name + after_paren
-                            
-                            # Escape problematic characters for VitePress/Vue
-                            method_display = method_display.replace('{', '\\{').replace('}', '\\}')
-                            method_display = method_display.replace('<', '\\<').replace('>', '\\>')
-                        else:
-                            # No parameters - just method name
-                            method_display = full_name.split('.')[-1]
-                        
-                        f.write(f"#### {method_display}\n\n")
-                        f.write(f"{method['summary']}\n\n")
-                        
-                        if method['parameters']:
-                            f.write("**Parameters:**\n\n")
-                            for param_name, param_desc in method['parameters']:
-                                f.write(f"- `{param_name}`: {param_desc}\n")
-                            f.write("\n")
-                        
-                        if method['returns']:
-                            f.write(f"**Returns:** {method['returns']}\n\n")
-                
-                # Add properties for this type
-                if type_name in properties:
-                    f.write("### Properties\n\n")
-                    for prop in properties[type_name][:5]:  # Limit properties per type
-                        prop_short = prop['name'].split('.')[-1]
-                        f.write(f"#### {prop_short}\n\n")
-                        f.write(f"{prop['summary']}\n\n")
-                
-                # Add examples
-                if type_info['examples']:
-                    f.write("### Examples\n\n")
-                    for i, example in enumerate(type_info['examples'][:2]):  # Limit examples
-                        # Clean up the example text and format properly
-                        clean_example = example.replace('&lt;', '<').replace('&gt;', '>')
-                        # Look for code sections
-                        if 'public class' in clean_example or '[Task' in clean_example:
-                            f.write(f"**Example {i+1}:**\n\n```csharp\n{clean_example}\n```\n\n")
-                        else:
-                            f.write(f"**Example {i+1}:**\n\n{clean_example}\n\n")
-                
-                f.write("---\n\n")
+            # Add examples
+            examples_block = ""
+            if type_info['examples']:
+                examples_block = "### Examples\n\n" + ''.join(
+                    render_example(i, example) for i, example in enumerate(type_info['examples'][:2])  # Limit examples
+                )
+            
+            append(TYPE_TEMPLATE.format_map({
+                'name': type_name,
+                'summary': type_info['summary'],
+                'remarks_block': remarks_block,
+                'methods_block': methods_block,
+                'properties_block': properties_block,
+                'examples_block': examples_block
+            }))
+        
+        readme = os.path.join(output_dir, "README.md")
+        with open(readme, 'w', encoding='utf-8') as f:
+            f.write(''.join(parts))
+        with open(os.path.join(output_dir, ".stamp"), 'w') as f:
+            f.write(f"{key}\n{total_members} {documented_members}\n{file_fingerprint(readme)}\n")
         
         print(f"✅ Generated comprehensive docs for {assembly_name}")
-        return True
+        return True, total_members, documented_members
         
     except Exception as e:
         print(f"❌ Error processing {xml_file}: {e}")
-        return False
+        return False, 0, 0
 
 def main():
     """Main function"""
-    xml_pattern = sys.argv[1] if len(sys.argv) > 1 else "belay-source/src/*/bin/Release/net8.0/*.xml"
-    xml_files = glob.glob(xml_pattern)
-    xml_files = [f for f in xml_files if '/ref/' not in f][:10]  # Limit files
+    # --force regenerates every assembly even if its XML is unchanged
+    force = '--force' in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != '--force']
+    
+    if args:
+        xml_files = [f for f in glob.glob(args[0]) if '/ref/' not in f]
+    else:
+        xml_files = list(iter_xml_files())
+    xml_files = xml_files[:10]  # Limit files
     
     print(f"Processing {len(xml_files)} XML files...")
     
@@ -199,31 +327,19 @@ def main():
     success_count = 0
     low_quality_count = 0
     
-    for xml_file in xml_files:
-        if os.path.exists(xml_file):
-            # Check if XML has substantial content
-            try:
-                tree = ET.parse(xml_file)
-                root = tree.getroot()
-                members = root.findall('.//member')
-                
-                # Count members with actual documentation
-                documented_count = 0
-                for member in members:
-                    summary = member.find('summary')
-                    if summary is not None and summary.text and len(summary.text.strip()) > 20:
-                        documented_count += 1
-                
-                # If less than 30% have substantial documentation, consider it low quality
-                if len(members) > 0 and documented_count / len(members) < 0.3:
-                    print(f"⚠️  {xml_file} has minimal documentation ({documented_count}/{len(members)} documented)")
-                    low_quality_count += 1
-                
-            except Exception:
-                pass
-            
-            if create_assembly_docs(xml_file):
-                success_count += 1
+    # Each assembly writes to its own output directory, so files are processed in parallel
+    existing_files = [f for f in xml_files if os.path.exists(f)]
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(functools.partial(create_assembly_docs, force=force), existing_files))
+    
+    for xml_file, (success, total_members, documented_count) in zip(existing_files, results):
+        if success:
+            success_count += 1
+        
+        # If less than 30% have substantial documentation, consider it low quality
+        if total_members > 0 and documented_count / total_members < 0.3:
+            print(f"⚠️  {xml_file} has minimal documentation ({documented_count}/{total_members} documented)")
+            low_quality_count += 1
     
     # Fail if XML documentation quality is insufficient
     if low_quality_count > 0:
@@ -240,24 +356,25 @@ def main():
     print(f"Successfully processed {success_count}/{len(xml_files)} XML files")
     
     # Create main API index
-    with open("api/index.md", "w") as f:
-        f.write("# API Reference\n\n")
-        f.write("Comprehensive API documentation automatically generated from XML comments.\n\n")
-        
-        # Check for generated docs
-        generated_dirs = []
-        api_generated = Path("api/generated")
-        if api_generated.exists():
-            generated_dirs = [d.name for d in api_generated.iterdir() if d.is_dir()]
-        
-        if generated_dirs:
-            f.write("## Generated Documentation\n\n")
-            for assembly in sorted(generated_dirs):
-                f.write(f"- **[{assembly}](./generated/{assembly}/README.md)** - {assembly} API documentation\n")
-        else:
-            f.write("## API Documentation\n\nAPI documentation will be available when XML files are processed.\n")
-        
-        f.write("""
+    parts = []
+    append = parts.append
+    append("# API Reference\n\n")
+    append("Comprehensive API documentation automatically generated from XML comments.\n\n")
+    
+    # Check for generated docs
+    generated_dirs = []
+    if os.path.isdir("api/generated"):
+        with os.scandir("api/generated") as entries:
+            generated_dirs = [entry.name for entry in entries if entry.is_dir()]
+    
+    if generated_dirs:
+        append("## Generated Documentation\n\n")
+        for assembly in sorted(generated_dirs):
+            append(f"- **[{assembly}](./generated/{assembly}/README.md)** - {assembly} API documentation\n")
+    else:
+        append("## API Documentation\n\nAPI documentation will be available when XML files are processed.\n")
+    
+    append("""
 
 ## Quick Reference
 
@@ -278,6 +395,9 @@ def main():
 For practical examples, see the [Examples](/examples/) section.
 """)
     
+    with open("api/index.md", 'w', encoding='utf-8') as f:
+        f.write(''.join(parts))
+    
     print("✅ Created main API index")
 
 if __name__ == "__main__":
@@ -13,15 +13,47 @@ import subprocess
 from pathlib import Path
 from collections import defaultdict
 import glob
-import requests
+import functools
+import urllib.request
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import List, Dict, Any
 
+# Patterns used for every cleaned doc string, compiled once
+WHITESPACE = re.compile(r'\s+')
+SEE_CREF = re.compile(r'&lt;see cref="[TMP]:([^"]+)"/&gt;')
+PARAMREF = re.compile(r'&lt;paramref name="([^"]+)"/&gt;')
+DOC_SLASHES = re.compile(r'^\s*///', re.MULTILINE)
+
+# Angle brackets escaped in doc text so Vue doesn't parse them as tags
+ANGLE_ESCAPES = str.maketrans({'<': '&lt;', '>': '&gt;'})
+
+# Opening of every versioned assembly README, up to the table of contents
+README_HEADER_TEMPLATE = """# {assembly} API Reference ({version})
+
+Comprehensive API documentation generated from XML documentation comments.
+
+::: info Version Information
+This documentation is for **{assembly} {version}**.
+For the latest version, see the [current API documentation](/api/).
+:::
+
+## Table of Contents
+
+"""
+
+# Characters dropped from lower-cased type names to form heading anchors
+ANCHOR_STRIP = str.maketrans('', '', '.<>`')
+
+# Seconds to wait on the GitHub API before giving up on release history
+GITHUB_TIMEOUT = 10
+
 def get_github_releases(repo: str) -> List[Dict[str, Any]]:
     """Fetch releases from GitHub API"""
     try:
-        response = requests.get(f"https://api.github.com/repos/{repo}/releases")
-        response.raise_for_status()
-        releases = response.json()
+        url = f"https://api.github.com/repos/{repo}/releases"
+        with urllib.request.urlopen(url, timeout=GITHUB_TIMEOUT) as response:
+            releases = json.load(response)
         
         # Filter out draft releases and sort by publication date
         published_releases = [r for r in releases if not r['draft']]
@@ -46,34 +78,35 @@ def get_local_version() -> str:
     # Fallback to main branch
     return "main"
 
+@functools.lru_cache(maxsize=4096)
 def clean_xml_text(text):
-    """Clean up XML text content"""
+    """Clean up XML text content (memoized; doc comments repeat a lot of boilerplate)"""
     if not text:
         return ""
     # Remove extra whitespace and normalize
-    text = re.sub(r'\s+', ' ', text.strip())
+    text = WHITESPACE.sub(' ', text.strip())
     # Escape angle brackets to prevent Vue parsing issues
-    text = text.replace('<', '&lt;').replace('>', '&gt;')
-    # Convert some common XML doc tags to markdown (after escaping)
-    text = text.replace('&lt;c&gt;', '`').replace('&lt;/c&gt;', '`')
-    text = re.sub(r'&lt;see cref="T:([^"]+)"/&gt;', r'`\1`', text)
-    text = re.sub(r'&lt;see cref="M:([^"]+)"/&gt;', r'`\1`', text)  
-    text = re.sub(r'&lt;see cref="P:([^"]+)"/&gt;', r'`\1`', text)
-    text = re.sub(r'&lt;paramref name="([^"]+)"/&gt;', r'`\1`', text)
+    text = text.translate(ANGLE_ESCAPES)
+    # Convert some common XML doc tags to markdown (after escaping); most text
+    # has none, so each conversion is skipped unless its tag is present
+    if '&lt;' not in text:
+        return text
+    if '&lt;c&gt;' in text or '&lt;/c&gt;' in text:
+        text = text.replace('&lt;c&gt;', '`').replace('&lt;/c&gt;', '`')
+    if '&lt;see cref' in text:
+        text = SEE_CREF.sub(r'`\1`', text)
+    if '&lt;paramref' in text:
+        text = PARAMREF.sub(r'`\1`', text)
     return text
 
-def extract_code_examples(text):
-    """Extract code examples from XML documentation"""
-    if not text:
-        return ""
-    
-    # Find <code> blocks
-    code_blocks = re.findall(r'<code>(.*?)</code>', text, re.DOTALL)
+def extract_code_examples(elem):
+    """Extract code examples from an XML documentation element"""
     markdown_code = ""
     
-    for code in code_blocks:
+    # Walk the <code> blocks directly rather than serializing and re-scanning the element
+    for code_elem in elem.iter('code'):
         # Clean up the code
-        code = re.sub(r'^\s*///', '', code, flags=re.MULTILINE)
+        code = DOC_SLASHES.sub('', ''.join(code_elem.itertext()))
         code = code.strip()
         if code:
             # Determine language (simple heuristic)
@@ -89,45 +122,50 @@ def process_member(member, member_type):
     # Remove type prefix (T:, M:, P:, F:)
     clean_name = name[2:] if name.startswith(('T:', 'M:', 'P:', 'F:')) else name
     
+    # Classify direct children in one pass instead of repeated find()/findall() scans
+    first = {}
+    params = []
+    exceptions = []
+    for child in member:
+        tag = child.tag
+        if tag == 'param':
+            # Get parameters (for methods)
+            param_name = child.get('name', '')
+            param_text = clean_xml_text(child.text or '')
+            if param_name and param_text:
+                params.append((param_name, param_text))
+        elif tag == 'exception':
+            # Get exceptions
+            exc_type = child.get('cref', '')
+            exc_text = clean_xml_text(child.text or '')
+            if exc_type and exc_text:
+                # Clean up cref format
+                exc_type = exc_type.replace('T:', '')
+                exceptions.append((exc_type, exc_text))
+        elif tag not in first:
+            first[tag] = child
+    
     # Get summary
-    summary_elem = member.find('summary')
+    summary_elem = first.get('summary')
     summary = clean_xml_text(summary_elem.text if summary_elem is not None else "")
     
     # Get remarks
-    remarks_elem = member.find('remarks')
+    remarks_elem = first.get('remarks')
     remarks = clean_xml_text(remarks_elem.text if remarks_elem is not None else "")
     
     # Get example
-    example_elem = member.find('example')
+    example_elem = first.get('example')
     example = ""
     if example_elem is not None:
-        example_text = ET.tostring(example_elem, encoding='unicode', method='text')
+        example_text = ''.join(example_elem.itertext())
         example = clean_xml_text(example_text)
         # Also check for code blocks
-        example += extract_code_examples(ET.tostring(example_elem, encoding='unicode'))
-    
-    # Get parameters (for methods)
-    params = []
-    for param in member.findall('param'):
-        param_name = param.get('name', '')
-        param_text = clean_xml_text(param.text or '')
-        if param_name and param_text:
-            params.append((param_name, param_text))
+        example += extract_code_examples(example_elem)
     
     # Get return value
-    returns_elem = member.find('returns')
+    returns_elem = first.get('returns')
     returns = clean_xml_text(returns_elem.text if returns_elem is not None else "")
     
-    # Get exceptions
-    exceptions = []
-    for exception in member.findall('exception'):
-        exc_type = exception.get('cref', '')
-        exc_text = clean_xml_text(exception.text or '')
-        if exc_type and exc_text:
-            # Clean up cref format
-            exc_type = exc_type.replace('T:', '')
-            exceptions.append((exc_type, exc_text))
-    
     return {
         'name': clean_name,
         'summary': summary,
@@ -142,164 +180,172 @@ def process_member(member, member_type):
 def process_xml_file(xml_path, version):
     """Convert XML documentation to markdown for a specific version"""
     try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-        
-        assembly_name = root.find('assembly/name').text
-        output_dir = Path(f"api/versions/{version}/{assembly_name}")
-        output_dir.mkdir(parents=True, exist_ok=True)
+        assembly_name = None
         
         # Group members by namespace and type
         namespaces = defaultdict(lambda: defaultdict(list))
         types = {}
         
-        # First pass: collect all types and organize by namespace
-        for member in root.findall('.//member'):
+        # Member kind prefix -> (member_type, key on the parent type)
+        member_kinds = {
+            'M:': ('method', 'methods'),
+            'P:': ('property', 'properties'),
+            'F:': ('field', 'fields')
+        }
+        
+        # Single streaming pass: collect types and organize by namespace, holding
+        # other members until every type is known. Processed members are dropped
+        # from <members>, so only the member being read is held in memory.
+        pending = []
+        members_elem = None
+        for event, member in ET.iterparse(xml_path, events=('start', 'end')):
+            if event == 'start':
+                if member.tag == 'members':
+                    members_elem = member
+                continue
+            if member.tag == 'assembly':
+                assembly_name = member.find('name').text
+                continue
+            if member.tag != 'member':
+                continue
+            
             name = member.get('name', '')
+            kind = name[:2]
             
-            if name.startswith('T:'):  # Type
+            if kind == 'T:':  # Type
                 type_info = process_member(member, 'type')
                 full_name = type_info['name']
                 
                 # Extract namespace
                 if '.' in full_name:
-                    namespace = '.'.join(full_name.split('.')[:-1])
-                    type_name = full_name.split('.')[-1]
+                    namespace, _, type_name = full_name.rpartition('.')
                 else:
                     namespace = assembly_name
                     type_name = full_name
                 
+                type_info['anchor'] = full_name.lower().translate(ANCHOR_STRIP)
                 types[full_name] = type_info
                 namespaces[namespace]['types'].append((type_name, full_name, type_info))
-        
-        # Second pass: collect members for each type
-        for member in root.findall('.//member'):
-            name = member.get('name', '')
+            elif kind in member_kinds:
+                member_type, key = member_kinds[kind]
+                pending.append((kind, key, process_member(member, member_type)))
             
-            if name.startswith('M:'):  # Method
-                member_info = process_member(member, 'method')
-                # Find parent type
-                method_name = member_info['name']
-                if '(' in method_name:
-                    method_name = method_name.split('(')[0]  # Remove parameters
-                type_name = '.'.join(method_name.split('.')[:-1])
-                if type_name in types:
-                    if 'methods' not in types[type_name]:
-                        types[type_name]['methods'] = []
-                    types[type_name]['methods'].append(member_info)
-                        
-            elif name.startswith('P:'):  # Property
-                member_info = process_member(member, 'property')
-                # Find parent type
-                prop_name = member_info['name']
-                type_name = '.'.join(prop_name.split('.')[:-1])
-                if type_name in types:
-                    if 'properties' not in types[type_name]:
-                        types[type_name]['properties'] = []
-                    types[type_name]['properties'].append(member_info)
-                        
-            elif name.startswith('F:'):  # Field
-                member_info = process_member(member, 'field')
-                # Find parent type
-                field_name = member_info['name']
-                type_name = '.'.join(field_name.split('.')[:-1])
-                if type_name in types:
-                    if 'fields' not in types[type_name]:
-                        types[type_name]['fields'] = []
-                    types[type_name]['fields'].append(member_info)
+            # Every child of <members> so far is complete, so release them all
+            if members_elem is not None:
+                members_elem.clear()
+            else:
+                member.clear()
+        
+        if assembly_name is None:
+            raise ValueError("no <assembly><name> element")
+        output_dir = Path(f"api/versions/{version}/{assembly_name}")
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Attach methods, properties and fields to their parent types
+        for kind, key, member_info in pending:
+            member_name = member_info['name']
+            if kind == 'M:' and '(' in member_name:
+                member_name = member_name.split('(')[0]  # Remove parameters
+            type_name, _, _ = member_name.rpartition('.')
+            if type_name in types:
+                types[type_name].setdefault(key, []).append(member_info)
+        
+        # Sort everything once so the table of contents and details render in order
+        by_name = itemgetter('name')
+        for type_info in types.values():
+            for key in ('methods', 'properties', 'fields'):
+                if key in type_info:
+                    type_info[key].sort(key=by_name)
+        for namespace_data in namespaces.values():
+            namespace_data['types'].sort()
+        sorted_namespaces = sorted(namespaces.items())
         
         # Generate main README
-        with open(output_dir / "README.md", "w") as f:
-            f.write(f"# {assembly_name} API Reference ({version})\n\n")
-            f.write("Comprehensive API documentation generated from XML documentation comments.\n\n")
-            f.write("::: info Version Information\n")
-            f.write(f"This documentation is for **{assembly_name} {version}**.\n")
-            f.write("For the latest version, see the [current API documentation](/api/).\n")
-            f.write(":::\n\n")
-            f.write("## Table of Contents\n\n")
-            
-            # Create table of contents
-            for namespace, namespace_data in sorted(namespaces.items()):
-                if namespace_data['types']:
-                    f.write(f"### {namespace}\n\n")
-                    for type_name, full_name, type_info in sorted(namespace_data['types']):
-                        f.write(f"- [{type_name}](#{full_name.lower().replace('.', '').replace('<', '').replace('>', '').replace('`', '')})\n")
-                    f.write("\n")
-            
-            f.write("\n---\n\n")
-            
-            # Generate detailed documentation
-            for namespace, namespace_data in sorted(namespaces.items()):
-                if namespace_data['types']:
-                    f.write(f"## {namespace}\n\n")
+        parts = [README_HEADER_TEMPLATE.format(assembly=assembly_name, version=version)]
+        
+        # Build the table of contents and detailed documentation in one walk
+        toc_parts = []
+        toc_append = toc_parts.append
+        detail_parts = []
+        detail_append = detail_parts.append
+        for namespace, namespace_data in sorted_namespaces:
+            if namespace_data['types']:
+                toc_append(f"### {namespace}\n\n")
+                detail_append(f"## {namespace}\n\n")
+                
+                for type_name, full_name, type_info in namespace_data['types']:
+                    toc_append(f"- [{type_name}](#{type_info['anchor']})\n")
+                    detail_append(f"### {full_name} {{#{type_info['anchor']}}}\n\n")
+                    
+                    if type_info['summary']:
+                        detail_append(f"{type_info['summary']}\n\n")
+                    
+                    if type_info['remarks']:
+                        detail_append(f"**Remarks**: {type_info['remarks']}\n\n")
+                    
+                    if type_info['example']:
+                        detail_append(f"**Example**:\n{type_info['example']}\n\n")
+                    
+                    # Add properties
+                    if 'properties' in type_info:
+                        detail_append("#### Properties\n\n")
+                        for prop in type_info['properties']:
+                            _, _, prop_name = prop['name'].rpartition('.')
+                            detail_append(f"**{prop_name}**\n\n")
+                            if prop['summary']:
+                                detail_append(f"{prop['summary']}\n\n")
+                            if prop['remarks']:
+                                detail_append(f"*Remarks*: {prop['remarks']}\n\n")
+                    
+                    # Add methods
+                    if 'methods' in type_info:
+                        detail_append("#### Methods\n\n")
+                        for method in type_info['methods']:
+                            _, _, method_name = method['name'].rpartition('.')
+                            if '(' in method_name:
+                                method_name = method_name.split('(')[0]
+                            detail_append(f"**{method_name}**\n\n")
+                            if method['summary']:
+                                detail_append(f"{method['summary']}\n\n")
+                            
+                            if method['parameters']:
+                                detail_append("*Parameters*:\n")
+                                for param_name, param_desc in method['parameters']:
+                                    detail_append(f"- `{param_name}`: {param_desc}\n")
+                                detail_append("\n")
+                            
+                            if method['returns']:
+                                detail_append(f"*Returns*: {method['returns']}\n\n")
+                            
+                            if method['exceptions']:
+                                detail_append("*Exceptions*:\n")
+                                for exc_type, exc_desc in method['exceptions']:
+                                    detail_append(f"- `{exc_type}`: {exc_desc}\n")
+                                detail_append("\n")
+                            
+                            if method['remarks']:
+                                detail_append(f"*Remarks*: {method['remarks']}\n\n")
+                            
+                            if method['example']:
+                                detail_append(f"*Example*:\n{method['example']}\n\n")
                     
-                    for type_name, full_name, type_info in sorted(namespace_data['types']):
-                        # Create anchor-friendly ID
-                        type_id = full_name.lower().replace('.', '').replace('<', '').replace('>', '').replace('`', '')
-                        f.write(f"### {full_name} {{#{type_id}}}\n\n")
-                        
-                        if type_info['summary']:
-                            f.write(f"{type_info['summary']}\n\n")
-                        
-                        if type_info['remarks']:
-                            f.write(f"**Remarks**: {type_info['remarks']}\n\n")
-                        
-                        if type_info['example']:
-                            f.write(f"**Example**:\n{type_info['example']}\n\n")
-                        
-                        # Add properties
-                        if 'properties' in type_info:
-                            f.write("#### Properties\n\n")
-                            for prop in sorted(type_info['properties'], key=lambda x: x['name']):
-                                prop_name = prop['name'].split('.')[-1]
-                                f.write(f"**{prop_name}**\n\n")
-                                if prop['summary']:
-                                    f.write(f"{prop['summary']}\n\n")
-                                if prop['remarks']:
-                                    f.write(f"*Remarks*: {prop['remarks']}\n\n")
-                        
-                        # Add methods
-                        if 'methods' in type_info:
-                            f.write("#### Methods\n\n")
-                            for method in sorted(type_info['methods'], key=lambda x: x['name']):
-                                method_name = method['name'].split('.')[-1]
-                                if '(' in method_name:
-                                    method_name = method_name.split('(')[0]
-                                f.write(f"**{method_name}**\n\n")
-                                if method['summary']:
-                                    f.write(f"{method['summary']}\n\n")
-                                
-                                if method['parameters']:
-                                    f.write("*Parameters*:\n")
-                                    for param_name, param_desc in method['parameters']:
-                                        f.write(f"- `{param_name}`: {param_desc}\n")
-                                    f.write("\n")
-                                
-                                if method['returns']:
-                                    f.write(f"*Returns*: {method['returns']}\n\n")
-                                
-                                if method['exceptions']:
-                                    f.write("*Exceptions*:\n")
-                                    for exc_type, exc_desc in method['exceptions']:
-                                        f.write(f"- `{exc_type}`: {exc_desc}\n")
-                                    f.write("\n")
-                                
-                                if method['remarks']:
-                                    f.write(f"*Remarks*: {method['remarks']}\n\n")
-                                
-                                if method['example']:
-                                    f.write(f"*Example*:\n{method['example']}\n\n")
-                        
-                        # Add fields
-                        if 'fields' in type_info:
-                            f.write("#### Fields\n\n")
-                            for field in sorted(type_info['fields'], key=lambda x: x['name']):
-                                field_name = field['name'].split('.')[-1]
-                                f.write(f"**{field_name}**\n\n")
-                                if field['summary']:
-                                    f.write(f"{field['summary']}\n\n")
-                        
-                        f.write("---\n\n")
+                    # Add fields
+                    if 'fields' in type_info:
+                        detail_append("#### Fields\n\n")
+                        for field in type_info['fields']:
+                            _, _, field_name = field['name'].rpartition('.')
+                            detail_append(f"**{field_name}**\n\n")
+                            if field['summary']:
+                                detail_append(f"{field['summary']}\n\n")
+                    
+                    detail_append("---\n\n")
+                
+                toc_append("\n")
+        
+        parts.extend(toc_parts)
+        parts.append("\n---\n\n")
+        parts.extend(detail_parts)
+        (output_dir / "README.md").write_text(''.join(parts), encoding='utf-8')
         
         print(f"✓ Generated comprehensive documentation for {assembly_name} {version}")
         return True
@@ -338,9 +384,16 @@ def main():
     """Main function to generate versioned API documentation"""
     print("🔄 Generating versioned API documentation...")
     
-    # Get available releases from GitHub
-    releases = get_github_releases("belay-dotnet/Belay.NET")
-    current_version = get_local_version()
+    # Fetch releases from GitHub in the background while the local lookups run
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        releases_future = executor.submit(get_github_releases, "belay-dotnet/Belay.NET")
+        current_version = get_local_version()
+        
+        # XML files for current version (from belay-source)
+        xml_files = glob.glob("belay-source/src/*/bin/Release/net8.0/*.xml")
+        xml_files = [f for f in xml_files if "ref" not in f]  # Skip reference assemblies
+        
+        releases = releases_future.result()
     
     versions = []
     if releases:
@@ -352,10 +405,6 @@ def main():
     
     print(f"📋 Processing versions: {', '.join(versions)}")
     
-    # Process XML files for current version (from belay-source)
-    xml_files = glob.glob("belay-source/src/*/bin/Release/net8.0/*.xml")
-    xml_files = [f for f in xml_files if "ref" not in f]  # Skip reference assemblies
-    
     # If no XML files found in belay-source, fall back to existing approach
     if not xml_files:
         print("⚠️ No XML files found in belay-source, falling back to direct generation...")
@@ -371,10 +420,10 @@ def main():
             print("⚠️ No XML documentation files available, skipping API generation")
             xml_files = []
     
-    success_count = 0
-    for xml_file in xml_files:
-        if process_xml_file(xml_file, current_version):
-            success_count += 1
+    # Each assembly writes to its own output directory, so files are processed in parallel
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(functools.partial(process_xml_file, version=current_version), xml_files))
+    success_count = sum(results)
     
     print(f"✓ Successfully processed {success_count} XML documentation files for {current_version}")
     
@@ -403,8 +452,9 @@ def main():
             f.write("## Generated Documentation\n\n")
             
             # Add links to generated docs
-            generated_dirs = [d for d in os.listdir("api/generated") if os.path.isdir(f"api/generated/{d}")]
-            for assembly in sorted(generated_dirs):
+            with os.scandir("api/generated") as entries:
+                generated_dirs = sorted(entry.name for entry in entries if entry.is_dir())
+            for assembly in generated_dirs:
                 f.write(f"- **[{assembly}](./generated/{assembly}/README.md)** - {assembly} namespace documentation\n")
             
             f.write("\n## Quick Reference\n\n")
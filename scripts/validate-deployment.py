@@ -7,14 +7,32 @@ Performs comprehensive checks on the built site before deployment
 import os
 import sys
 import json
+import mmap
 from pathlib import Path
 import re
 from urllib.parse import urlparse, urljoin
 from collections import defaultdict
 
+# Characters of each page read for the content quality checks; longer pages
+# are searched for the placeholder in place with file_contains
+CONTENT_SAMPLE_SIZE = 64 * 1024
+
+# Links into the main site sections, matched in one pass over the page
+NAV_LINK = re.compile(r'href="[^"]*(?:guide|examples|api|hardware)[^"]*"')
+
+def file_contains(path, needle):
+    """Search a file for the bytes needle in place, without reading or decoding it"""
+    with open(path, 'rb') as f:
+        # mmap rejects empty files
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(needle) != -1
+
 class DeploymentValidator:
     def __init__(self, dist_path=".vitepress/dist"):
         self.dist_path = Path(dist_path)
+        self._dist_str = str(dist_path)
         self.errors = []
         self.warnings = []
         self.stats = defaultdict(int)
@@ -46,8 +64,7 @@ class DeploymentValidator:
         ]
         
         for file_path in critical_files:
-            full_path = self.dist_path / file_path
-            if not full_path.exists():
+            if not os.path.isfile(os.path.join(self._dist_str, file_path)):
                 self.log_error(f"Critical file missing: {file_path}")
             else:
                 self.stats["critical_files"] += 1
@@ -74,10 +91,8 @@ class DeploymentValidator:
                 
                 # Check if it's fallback documentation
                 try:
-                    with open(assembly_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        if "Fallback documentation" in content:
-                            fallback_count += 1
+                    if file_contains(assembly_path, b"Fallback documentation"):
+                        fallback_count += 1
                 except Exception:
                     pass
             else:
@@ -103,17 +118,9 @@ class DeploymentValidator:
                 content = f.read()
                 
             # Look for navigation patterns that might be broken
-            nav_patterns = [
-                r'href="[^"]*guide[^"]*"',
-                r'href="[^"]*examples[^"]*"', 
-                r'href="[^"]*api[^"]*"',
-                r'href="[^"]*hardware[^"]*"'
-            ]
-            
-            for pattern in nav_patterns:
-                matches = re.findall(pattern, content)
-                if matches:
-                    self.stats["nav_links"] += len(matches)
+            matches = NAV_LINK.findall(content)
+            if matches:
+                self.stats["nav_links"] += len(matches)
                     
             # Check for obvious broken link indicators
             if '404' in content and ('nav' in content.lower() or 'menu' in content.lower()):
@@ -137,8 +144,7 @@ class DeploymentValidator:
                 else:
                     # Count files in directory
                     try:
-                        files = list(asset_path.rglob("*"))
-                        file_count = len([f for f in files if f.is_file()])
+                        file_count = sum(len(filenames) for _, _, filenames in os.walk(asset_path))
                         self.stats["assets"] += file_count
                     except Exception:
                         pass
@@ -161,12 +167,15 @@ class DeploymentValidator:
             if page_path.exists():
                 try:
                     with open(page_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                        content = f.read(CONTENT_SAMPLE_SIZE)
                         
                     # Basic checks for placeholder content
                     if len(content) < 500:  # Very minimal content
                         self.log_warning(f"Page {page} has very little content ({len(content)} chars)")
-                    elif "Documentation in Progress" in content:
+                    elif "Documentation in Progress" in content or (
+                            # Only pages longer than the sample need the rest searched
+                            len(content) == CONTENT_SAMPLE_SIZE
+                            and file_contains(page_path, b"Documentation in Progress")):
                         self.log_warning(f"Page {page} still contains placeholder content")
                     else:
                         self.stats["quality_pages"] += 1